@@ -9,126 +9,59 @@ Reads workflow-state.json and generates a markdown handoff document.
 """
 
 import json
+import os
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
+from typing import NamedTuple
+
+# Prefer orjson for parsing when available, falling back to the stdlib
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 # Paths
 WORKFLOW_STATE_PATH = Path("ARTIFACTS/system/workflow-state.json")
 OUTPUT_PATH = Path("ARTIFACTS/system/workflow-handoff.md")
 
-# Stage to artifact mapping
-STAGE_ARTIFACTS = {
-    "requirements": "ARTIFACTS/product-manager/product-requirements-packet.json",
-    "architecture": "ARTIFACTS/system-architect/architecture-handover-packet.json",
-    "frontend_implementation": "ARTIFACTS/frontend-engineer/frontend-implementation-report.json",
-    "backend_implementation": "ARTIFACTS/backend-engineer/backend-implementation-report.json",
-    "ai_implementation": "ARTIFACTS/ai-engineer/ai-implementation-report.json",
-    "qa_testing": "ARTIFACTS/qa-engineer/qa-test-report.json",
-    "deployment": "ARTIFACTS/devops-engineer/deployment-report.json",
-    "safety_review": "ARTIFACTS/system/safety-review-report.json",
-    "governance_review": "ARTIFACTS/system/governance-review-report.json",
-    "code_health_assessment": "ARTIFACTS/system/code-health-report.json",
-}
-
-STAGE_AGENTS = {
-    "requirements": "product_manager",
-    "architecture": "system_architect",
-    "frontend_implementation": "frontend_engineer",
-    "backend_implementation": "backend_engineer",
-    "ai_implementation": "ai_engineer",
-    "qa_testing": "qa_engineer",
-    "deployment": "devops_engineer",
-    "safety_review": "safety_agent",
-    "governance_review": "governance_agent",
-    "code_health_assessment": "code_health_agent",
-}
-
-
-def load_workflow_state():
-    """Load workflow state from JSON file."""
-    if not WORKFLOW_STATE_PATH.exists():
-        print(f"ERROR: Workflow state not found at {WORKFLOW_STATE_PATH}")
-        sys.exit(1)
-
-    with open(WORKFLOW_STATE_PATH) as f:
-        return json.load(f)
-
-
-def get_stage_status(state: dict, stage: str) -> str:
-    """Get status for a specific stage."""
-    stages = state.get("stages", {})
-    if stage in stages:
-        return stages[stage].get("status", "pending")
-    return "not_applicable"
-
-
-def get_pending_gates(state: dict) -> list:
-    """Get list of pending human approval gates."""
-    gates = []
-    stages = state.get("stages", {})
-
-    for stage_name, stage_data in stages.items():
-        if stage_data.get("human_approval_required") and not stage_data.get("human_approval_received"):
-            status = stage_data.get("status", "pending")
-            if status in ["completed", "in_progress"]:
-                gates.append({
-                    "gate_name": f"{stage_name}_approval",
-                    "stage": stage_name,
-                    "action": f"Review and approve {stage_name} output"
-                })
-
-    return gates
-
-
-def get_completed_artifacts(state: dict) -> list:
-    """Get list of completed artifacts."""
-    artifacts = []
-    stages = state.get("stages", {})
-
-    for stage_name, stage_data in stages.items():
-        if stage_data.get("status") == "completed":
-            artifact_path = STAGE_ARTIFACTS.get(stage_name, "")
-            if artifact_path and Path(artifact_path).exists():
-                artifacts.append({
-                    "path": artifact_path,
-                    "description": f"Output from {stage_name} stage"
-                })
-
-    return artifacts
-
-
-def get_pending_artifacts(state: dict) -> list:
-    """Get list of pending artifacts."""
-    artifacts = []
-    stages = state.get("stages", {})
-
-    for stage_name, stage_data in stages.items():
-        if stage_data.get("status") in ["pending", "in_progress"]:
-            artifact_path = STAGE_ARTIFACTS.get(stage_name, "")
-            agent = STAGE_AGENTS.get(stage_name, "unknown")
-            if artifact_path:
-                artifacts.append({
-                    "path": artifact_path,
-                    "agent": agent
-                })
-
-    return artifacts
-
-
-def generate_handoff(state: dict) -> str:
-    """Generate markdown handoff document from workflow state."""
-    timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-
-    # Get stage statuses
-    stages = state.get("stages", {})
-
-    # Build document
-    doc = f"""# Workflow Handoff Document
+# Stage, owning agent and output artifact, in workflow order
+STAGE_META = (
+    ("requirements", "product_manager", "ARTIFACTS/product-manager/product-requirements-packet.json"),
+    ("architecture", "system_architect", "ARTIFACTS/system-architect/architecture-handover-packet.json"),
+    ("frontend_implementation", "frontend_engineer", "ARTIFACTS/frontend-engineer/frontend-implementation-report.json"),
+    ("backend_implementation", "backend_engineer", "ARTIFACTS/backend-engineer/backend-implementation-report.json"),
+    ("ai_implementation", "ai_engineer", "ARTIFACTS/ai-engineer/ai-implementation-report.json"),
+    ("qa_testing", "qa_engineer", "ARTIFACTS/qa-engineer/qa-test-report.json"),
+    ("deployment", "devops_engineer", "ARTIFACTS/devops-engineer/deployment-report.json"),
+    ("safety_review", "safety_agent", "ARTIFACTS/system/safety-review-report.json"),
+    ("governance_review", "governance_agent", "ARTIFACTS/system/governance-review-report.json"),
+    ("code_health_assessment", "code_health_agent", "ARTIFACTS/system/code-health-report.json"),
+)
+
+_KNOWN_STAGES = frozenset(stage for stage, _, _ in STAGE_META)
+
+# STAGE_META expanded with each artifact's directory and file name and its
+# pre-rendered Stage Progress row, where only the status cell varies
+_STAGE_ROWS = tuple(
+    (
+        stage,
+        agent,
+        path,
+        path.rsplit("/", 1)[0],
+        path.rsplit("/", 1)[-1],
+        f"| {stage} | {{status}} | {agent} | `{path.rsplit('/', 1)[-1]}` |\n",
+    )
+    for stage, agent, path in STAGE_META
+)
+
+# Handoff document skeleton; variable sections are rendered by generate_handoff
+HANDOFF_TEMPLATE = """# Workflow Handoff Document
 
 **Generated**: {timestamp}
-**Workflow ID**: {state.get('workflow_id', 'N/A')}
-**Product Name**: {state.get('product_name', 'N/A')}
+**Workflow ID**: {workflow_id}
+**Product Name**: {product_name}
 
 ---
 
@@ -136,9 +69,9 @@ def generate_handoff(state: dict) -> str:
 
 | Field | Value |
 |-------|-------|
-| Execution Mode | {state.get('execution_mode', 'N/A')} |
-| Current Stage | {state.get('current_stage', 'N/A')} |
-| Overall Status | {'active' if state.get('current_stage') not in ['completed', 'failed'] else state.get('current_stage')} |
+| Execution Mode | {execution_mode} |
+| Current Stage | {current_stage} |
+| Overall Status | {overall_status} |
 
 ---
 
@@ -146,16 +79,7 @@ def generate_handoff(state: dict) -> str:
 
 | Stage | Status | Agent | Output Artifact |
 |-------|--------|-------|-----------------|
-"""
-
-    # Add stage rows
-    for stage, artifact in STAGE_ARTIFACTS.items():
-        status = get_stage_status(state, stage)
-        agent = STAGE_AGENTS.get(stage, "unknown")
-        artifact_name = Path(artifact).name
-        doc += f"| {stage} | {status} | {agent} | `{artifact_name}` |\n"
-
-    doc += """
+{stage_rows}
 ---
 
 ## Outstanding Gates
@@ -164,47 +88,19 @@ def generate_handoff(state: dict) -> str:
 
 | Gate | Stage | Status | Required Action |
 |------|-------|--------|-----------------|
-"""
-
-    pending_gates = get_pending_gates(state)
-    if pending_gates:
-        for gate in pending_gates:
-            doc += f"| {gate['gate_name']} | {gate['stage']} | Awaiting | {gate['action']} |\n"
-    else:
-        doc += "| (none) | - | - | - |\n"
-
-    # Safety and governance
-    safety_status = state.get("safety_and_governance", {}).get("safety_review_status", "pending")
-    gov_status = state.get("safety_and_governance", {}).get("governance_review_status", "pending")
-
-    doc += f"""
+{gate_rows}
 ### Safety/Governance Gates
 
 | Gate | Status | Risk Level |
 |------|--------|------------|
-| Safety Review | {safety_status} | {state.get('safety_and_governance', {}).get('risk_level', 'not assessed')} |
+| Safety Review | {safety_status} | {risk_level} |
 | Governance Review | {gov_status} | - |
 
 ---
 
 ## Blocking Issues
 
-"""
-
-    blocking_issues = state.get("blocking_issues", [])
-    if blocking_issues:
-        for i, issue in enumerate(blocking_issues, 1):
-            doc += f"""### Issue {i}: {issue.get('description', 'Unknown')}
-
-- **Severity**: {issue.get('severity', 'unknown')}
-- **Source**: {issue.get('source_stage', 'unknown')}
-- **Resolution Required**: {issue.get('resolution', 'Not specified')}
-
-"""
-    else:
-        doc += "*No blocking issues*\n"
-
-    doc += """
+{blocking_issues}
 ---
 
 ## Artifact Locations
@@ -226,48 +122,17 @@ def generate_handoff(state: dict) -> str:
 
 ### Completed Artifacts
 
-"""
-
-    completed = get_completed_artifacts(state)
-    if completed:
-        for artifact in completed:
-            doc += f"- `{artifact['path']}` - {artifact['description']}\n"
-    else:
-        doc += "*No completed artifacts yet*\n"
-
-    doc += """
+{completed_list}
 ### Pending Artifacts
 
-"""
-
-    pending = get_pending_artifacts(state)
-    if pending:
-        for artifact in pending:
-            doc += f"- `{artifact['path']}` - Awaiting {artifact['agent']}\n"
-    else:
-        doc += "*No pending artifacts*\n"
-
-    doc += """
+{pending_list}
 ---
 
 ## Human Interaction Log
 
 | Timestamp | Stage | Interaction Type | Details |
 |-----------|-------|------------------|---------|
-"""
-
-    interactions = state.get("human_interactions", [])
-    if interactions:
-        for interaction in interactions:
-            doc += f"| {interaction.get('timestamp', 'N/A')} | {interaction.get('stage', 'N/A')} | {interaction.get('interaction_type', 'N/A')} | {interaction.get('details', 'N/A')} |\n"
-    else:
-        doc += "| (none) | - | - | - |\n"
-
-    # Determine next stage for resume instructions
-    current = state.get("current_stage", "requirements")
-    next_approval = "requirements" if current == "requirements" else current
-
-    doc += f"""
+{interaction_rows}
 ---
 
 ## Resume Instructions
@@ -293,20 +158,202 @@ def generate_handoff(state: dict) -> str:
 
 ---
 
-**Last Updated**: {state.get('updated_at', timestamp)}
+**Last Updated**: {updated_at}
 """
 
-    return doc
+
+def load_workflow_state():
+    """Load workflow state from JSON file."""
+    if not WORKFLOW_STATE_PATH.exists():
+        print(f"ERROR: Workflow state not found at {WORKFLOW_STATE_PATH}")
+        sys.exit(1)
+
+    with open(WORKFLOW_STATE_PATH, "rb") as f:
+        return _loads(f.read())
+
+
+def _list_dir(directory: str) -> set:
+    """Return the entry names of a directory, or an empty set if it is missing."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def _awaits_approval(stage_data: dict, status: str) -> bool:
+    """Whether a stage has produced output that still needs human approval."""
+    return (
+        status in ("completed", "in_progress")
+        and bool(stage_data.get("human_approval_required"))
+        and not stage_data.get("human_approval_received")
+    )
+
+
+def _approval_gate(stage: str) -> dict:
+    """Describe the human approval gate for a stage."""
+    return {
+        "gate_name": f"{stage}_approval",
+        "stage": stage,
+        "action": f"Review and approve {stage} output"
+    }
+
+
+class StageSummary(NamedTuple):
+    """Derived per-stage data for the handoff document."""
+    rows: list
+    pending_gates: list
+    completed: list
+    pending: list
+    safety: str
+    gov: str
+    risk: str
+
+
+def _summarize(state: dict) -> StageSummary:
+    """Walk the stages once, collecting table rows, gates and artifacts."""
+    stages = state.get("stages", {})
+    rows = []
+    pending_gates = []
+    completed = []
+    pending = []
+    listings = {}
+
+    for stage, agent, artifact_path, directory, name, row_template in _STAGE_ROWS:
+        if stage not in stages:
+            rows.append(row_template.format(status="not_applicable"))
+            continue
+
+        stage_data = stages[stage]
+        raw_status = stage_data.get("status")
+        status = raw_status if "status" in stage_data else "pending"
+        rows.append(row_template.format(status=status))
+
+        if _awaits_approval(stage_data, status):
+            pending_gates.append(_approval_gate(stage))
+
+        if raw_status == "completed":
+            if directory not in listings:
+                listings[directory] = _list_dir(directory)
+            if name in listings[directory]:
+                completed.append({
+                    "path": artifact_path,
+                    "description": f"Output from {stage} stage"
+                })
+        elif raw_status in ("pending", "in_progress"):
+            pending.append({
+                "path": artifact_path,
+                "agent": agent
+            })
+
+    # Stages outside STAGE_META have no row or artifact, but can still gate
+    for stage, stage_data in stages.items():
+        if stage not in _KNOWN_STAGES and _awaits_approval(stage_data, stage_data.get("status", "pending")):
+            pending_gates.append(_approval_gate(stage))
+
+    sg = state.get("safety_and_governance") or {}
+    return StageSummary(
+        rows=rows,
+        pending_gates=pending_gates,
+        completed=completed,
+        pending=pending,
+        safety=sg.get("safety_review_status", "pending"),
+        gov=sg.get("governance_review_status", "pending"),
+        risk=sg.get("risk_level", "not assessed"),
+    )
+
+
+def generate_handoff(state: dict) -> str:
+    """Generate markdown handoff document from workflow state."""
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    summary = _summarize(state)
+
+    if summary.pending_gates:
+        gate_rows = "".join(
+            f"| {gate['gate_name']} | {gate['stage']} | Awaiting | {gate['action']} |\n"
+            for gate in summary.pending_gates
+        )
+    else:
+        gate_rows = "| (none) | - | - | - |\n"
+
+    blocking_issues = state.get("blocking_issues", [])
+    if blocking_issues:
+        blocking = "".join(
+            f"""### Issue {i}: {issue.get('description', 'Unknown')}
+
+- **Severity**: {issue.get('severity', 'unknown')}
+- **Source**: {issue.get('source_stage', 'unknown')}
+- **Resolution Required**: {issue.get('resolution', 'Not specified')}
+
+"""
+            for i, issue in enumerate(blocking_issues, 1)
+        )
+    else:
+        blocking = "*No blocking issues*\n"
+
+    if summary.completed:
+        completed_list = "".join(
+            f"- `{artifact['path']}` - {artifact['description']}\n"
+            for artifact in summary.completed
+        )
+    else:
+        completed_list = "*No completed artifacts yet*\n"
+
+    if summary.pending:
+        pending_list = "".join(
+            f"- `{artifact['path']}` - Awaiting {artifact['agent']}\n"
+            for artifact in summary.pending
+        )
+    else:
+        pending_list = "*No pending artifacts*\n"
+
+    interactions = state.get("human_interactions", [])
+    if interactions:
+        interaction_rows = "".join(
+            f"| {interaction.get('timestamp', 'N/A')} | {interaction.get('stage', 'N/A')} | {interaction.get('interaction_type', 'N/A')} | {interaction.get('details', 'N/A')} |\n"
+            for interaction in interactions
+        )
+    else:
+        interaction_rows = "| (none) | - | - | - |\n"
+
+    # Determine next stage for resume instructions
+    current = state.get("current_stage", "requirements")
+    next_approval = "requirements" if current == "requirements" else current
+
+    return HANDOFF_TEMPLATE.format_map({
+        "timestamp": timestamp,
+        "workflow_id": state.get("workflow_id", "N/A"),
+        "product_name": state.get("product_name", "N/A"),
+        "execution_mode": state.get("execution_mode", "N/A"),
+        "current_stage": state.get("current_stage", "N/A"),
+        "overall_status": "active" if state.get("current_stage") not in ["completed", "failed"] else state.get("current_stage"),
+        "stage_rows": "".join(summary.rows),
+        "gate_rows": gate_rows,
+        "safety_status": summary.safety,
+        "gov_status": summary.gov,
+        "risk_level": summary.risk,
+        "blocking_issues": blocking,
+        "completed_list": completed_list,
+        "pending_list": pending_list,
+        "interaction_rows": interaction_rows,
+        "current": current,
+        "next_approval": next_approval,
+        "updated_at": state.get("updated_at", timestamp),
+    })
 
 
 def main():
     """Main entry point."""
-    import argparse
+    # Only pay for importing argparse when there are arguments to parse
+    if len(sys.argv) == 1:
+        output = OUTPUT_PATH
+    else:
+        import argparse
 
-    parser = argparse.ArgumentParser(description="Generate workflow handoff document")
-    parser.add_argument("--output", "-o", type=Path, default=OUTPUT_PATH,
-                        help="Output path for handoff document")
-    args = parser.parse_args()
+        parser = argparse.ArgumentParser(description="Generate workflow handoff document")
+        parser.add_argument("--output", "-o", type=Path, default=OUTPUT_PATH,
+                            help="Output path for handoff document")
+        output = parser.parse_args().output
 
     # Load state
     state = load_workflow_state()
@@ -315,11 +362,10 @@ def main():
     doc = generate_handoff(state)
 
     # Write output
-    args.output.parent.mkdir(parents=True, exist_ok=True)
-    with open(args.output, "w") as f:
-        f.write(doc)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(doc, encoding="utf-8")
 
-    print(f"Handoff document generated: {args.output}")
+    print(f"Handoff document generated: {output}")
 
 
 if __name__ == "__main__":
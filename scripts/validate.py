@@ -2,25 +2,31 @@
 """
 AI-Native Development System - Schema Validation Script (Python)
 
-Full JSON Schema validation using Python's jsonschema library (if available)
-or basic structural validation as fallback.
+Full JSON Schema validation using fastjsonschema or Python's jsonschema
+library (if available) or basic structural validation as fallback.
+fastjsonschema reports only the first error per artifact; jsonschema reports all.
 
 Usage:
     python scripts/validate.py <artifact> [schema]
     python scripts/validate.py --all
     python scripts/validate.py --check-deps
 
+--all reuses results for unchanged artifacts from ARTIFACTS/.validate-cache.json;
+delete that file to force a full re-validation.
+
 Examples:
     python scripts/validate.py ARTIFACTS/system/stage-completion-signal.json
     python scripts/validate.py --all
 """
 
+import functools
 import json
+import re
 import sys
 import os
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
 # Try to import jsonschema, but don't fail if not available
 try:
@@ -29,6 +35,22 @@ try:
 except ImportError:
     HAS_JSONSCHEMA = False
 
+# fastjsonschema generates specialized validator code per schema
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+# Prefer orjson for parsing when available, falling back to the stdlib
+try:
+    import orjson
+    _loads = orjson.loads
+    HAS_ORJSON = True
+except ImportError:
+    _loads = json.loads
+    HAS_ORJSON = False
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -38,6 +60,14 @@ ROOT_DIR = SCRIPT_DIR.parent
 CONTRACTS_DIR = ROOT_DIR / "L3 - Workflows & Contracts" / "contracts"
 ARTIFACTS_DIR = ROOT_DIR / "ARTIFACTS"
 
+# Results of previous --all runs, keyed by artifact path
+VALIDATE_CACHE_PATH = ARTIFACTS_DIR / ".validate-cache.json"
+VALIDATE_CACHE_VERSION = 1
+
+# Starting a process pool costs ~15 ms while an artifact validates in well
+# under 1 ms, so smaller batches of stale artifacts are validated serially
+PARALLEL_MIN_ARTIFACTS = 200
+
 # Artifact to schema mapping
 ARTIFACT_SCHEMA_MAP = {
     "product-requirements-packet.json": "pm-output-schema.json",
@@ -58,6 +88,8 @@ ARTIFACT_SCHEMA_MAP = {
     "project-config.json": "project-config-schema.json",
 }
 
+_KNOWN_NAMES = frozenset(ARTIFACT_SCHEMA_MAP)
+
 # Valid enum values for stage-completion-signal
 VALID_AGENTS = [
     "product_manager", "system_architect", "frontend_engineer",
@@ -76,6 +108,31 @@ VALID_STATUSES = [
     "blocked", "requires_human_intervention"
 ]
 
+VALID_EXECUTION_MODES = ["full_system", "fast_feature"]
+
+# Extra structural checks applied by the basic (no jsonschema) validator
+FALLBACK_RULES = {
+    "stage-completion-signal.json": {
+        "required": ["agent", "stage", "status", "timestamp"],
+        "enums": {"agent": VALID_AGENTS, "stage": VALID_STAGES, "status": VALID_STATUSES},
+        "timestamps": ["timestamp"],
+        "blocked_requires_issues": True,
+    },
+    "workflow-state.json": {
+        "required": ["workflow_id", "execution_mode", "current_stage", "stages", "created_at", "updated_at"],
+        "enums": {"execution_mode": VALID_EXECUTION_MODES},
+    },
+}
+
+# Timestamps that are always valid ISO 8601. Days 29-31 and other forms fall
+# back to datetime.fromisoformat for the exact answer.
+_ISO_TIMESTAMP_RE = re.compile(
+    r"(?!0000)\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|1\d|2[0-8])"
+    r"T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d{3}|\.\d{6})?"
+    r"(?:Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)?\Z",
+    re.ASCII,
+)
+
 # =============================================================================
 # Colors
 # =============================================================================
@@ -101,16 +158,22 @@ if not sys.stdout.isatty():
 def load_json(filepath: Path) -> Tuple[Optional[Dict], Optional[str]]:
     """Load and parse JSON file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f), None
-    except json.JSONDecodeError as e:
-        return None, f"Invalid JSON syntax: {e}"
+        with open(filepath, 'rb') as f:
+            return _loads(f.read()), None
     except FileNotFoundError:
         return None, f"File not found: {filepath}"
+    except ValueError as e:
+        return None, f"Invalid JSON syntax: {e}"
     except Exception as e:
         return None, f"Error reading file: {e}"
 
 
+@functools.lru_cache(maxsize=None)
+def _load_schema_cached(schema_path: str) -> Tuple[Optional[Dict], Optional[str]]:
+    """Load and parse a schema file once per process."""
+    return load_json(Path(schema_path))
+
+
 def get_schema_path(artifact_path: Path) -> Optional[Path]:
     """Get schema path for an artifact."""
     artifact_name = artifact_path.name
@@ -120,32 +183,53 @@ def get_schema_path(artifact_path: Path) -> Optional[Path]:
     return None
 
 
-def validate_with_jsonschema(data: Dict, schema: Dict) -> List[str]:
-    """Validate using jsonschema library."""
-    errors = []
+@functools.lru_cache(maxsize=None)
+def _validator_for(schema_path: str) -> Callable[[Dict], List[str]]:
+    """Build a reusable validator for a schema file, compiled once per process."""
+    schema, _ = _load_schema_cached(schema_path)
+
+    if HAS_FASTJSONSCHEMA:
+        try:
+            validate = fastjsonschema.compile(schema, use_formats=False)
+        except fastjsonschema.JsonSchemaDefinitionException as e:
+            schema_error = f"Schema error: {e}"
+            return lambda data: [schema_error]
+
+        def validate_with_fastjsonschema(data: Dict) -> List[str]:
+            # fastjsonschema stops at the first error; report it in the same
+            # "path: message" shape as jsonschema, e.g. "$.stages: must be object"
+            try:
+                validate(data)
+            except fastjsonschema.JsonSchemaValueException as e:
+                message = e.message
+                if e.name and message.startswith(e.name + " "):
+                    message = message[len(e.name) + 1:]
+                json_path = "$" + e.name[len("data"):] if e.name else "$"
+                return [f"{json_path}: {message}"]
+            return []
+
+        return validate_with_fastjsonschema
+
+    cls = jsonschema.validators.validator_for(schema)
     try:
-        jsonschema.validate(instance=data, schema=schema)
-    except jsonschema.ValidationError as e:
-        errors.append(f"{e.json_path}: {e.message}")
+        cls.check_schema(schema)
     except jsonschema.SchemaError as e:
-        errors.append(f"Schema error: {e.message}")
-    return errors
+        schema_error = f"Schema error: {e.message}"
+        return lambda data: [schema_error]
+    validator = cls(schema)
 
+    def validate_with_jsonschema(data: Dict) -> List[str]:
+        return [f"{e.json_path}: {e.message}" for e in validator.iter_errors(data)]
 
-def validate_required_fields(data: Dict, schema: Dict) -> List[str]:
-    """Basic validation of required fields."""
-    errors = []
-    required = schema.get("required", [])
-    for field in required:
-        if field not in data:
-            errors.append(f"Missing required field: {field}")
-    return errors
+    return validate_with_jsonschema
 
 
-def validate_enum(value: Any, valid_values: List[str], field_name: str) -> Optional[str]:
-    """Validate enum value."""
-    if value is not None and value not in valid_values:
-        return f"Invalid {field_name}: '{value}' (valid: {', '.join(valid_values)})"
+def validate_enum(value: Any, valid_set: FrozenSet[str], valid_str: str, field_name: str) -> Optional[str]:
+    """Validate enum value against a precomputed set and its display string."""
+    # Valid values are all strings; checking the type first also keeps
+    # unhashable values (lists, dicts) out of the set lookup
+    if value is not None and (not isinstance(value, str) or value not in valid_set):
+        return f"Invalid {field_name}: '{value}' (valid: {valid_str})"
     return None
 
 
@@ -153,6 +237,11 @@ def validate_timestamp(value: str) -> Optional[str]:
     """Validate ISO 8601 timestamp."""
     if not value:
         return "Empty timestamp"
+    if not isinstance(value, str):
+        return f"Invalid timestamp format: '{value}' (expected ISO 8601)"
+    # Common well-formed timestamps match without building a datetime
+    if _ISO_TIMESTAMP_RE.match(value):
+        return None
     try:
         # Try parsing ISO 8601 format
         if value.endswith('Z'):
@@ -164,133 +253,225 @@ def validate_timestamp(value: str) -> Optional[str]:
         return f"Invalid timestamp format: '{value}' (expected ISO 8601)"
 
 
-def validate_stage_completion_signal(data: Dict) -> List[str]:
-    """Validate stage-completion-signal structure."""
-    errors = []
-
-    # Required fields
-    required = ["agent", "stage", "status", "timestamp"]
-    for field in required:
-        if field not in data:
-            errors.append(f"Missing required field: {field}")
-
-    # Validate enums
-    if err := validate_enum(data.get("agent"), VALID_AGENTS, "agent"):
-        errors.append(err)
-    if err := validate_enum(data.get("stage"), VALID_STAGES, "stage"):
-        errors.append(err)
-    if err := validate_enum(data.get("status"), VALID_STATUSES, "status"):
-        errors.append(err)
-
-    # Validate timestamp
-    if "timestamp" in data:
-        if err := validate_timestamp(data["timestamp"]):
-            errors.append(err)
-
-    # If blocked, should have blocking_issues
-    if data.get("status") == "blocked" and not data.get("blocking_issues"):
-        errors.append("Status is 'blocked' but no blocking_issues provided (warning)")
-
-    return errors
-
+def build_validator(schema: Dict, artifact_name: str) -> Callable[[Dict], List[str]]:
+    """
+    Generate a basic validator function for a schema.
 
-def validate_workflow_state(data: Dict) -> List[str]:
-    """Validate workflow-state structure."""
-    errors = []
+    Field names and enum values are baked into the generated source, so the
+    resulting function does not consult the schema at validation time.
+    """
+    rules = FALLBACK_RULES.get(artifact_name, {})
+    required = dict.fromkeys(schema.get("required", []) + rules.get("required", []))
+    namespace = {"validate_enum": validate_enum, "validate_timestamp": validate_timestamp}
 
-    # Required fields
-    required = ["workflow_id", "execution_mode", "current_stage", "stages", "created_at", "updated_at"]
+    src = ["def validate(data):", "    errors = []"]
     for field in required:
-        if field not in data:
-            errors.append(f"Missing required field: {field}")
-
-    # Validate execution_mode
-    mode = data.get("execution_mode")
-    if mode and mode not in ["full_system", "fast_feature"]:
-        errors.append(f"Invalid execution_mode: '{mode}'")
-
-    return errors
+        src.append(f"    if {field!r} not in data:")
+        src.append(f"        errors.append({'Missing required field: ' + field!r})")
+    for field, valid_values in rules.get("enums", {}).items():
+        name = f"_valid_{len(namespace)}"
+        namespace[name] = frozenset(valid_values)
+        namespace[name + "_str"] = ", ".join(valid_values)
+        src.append(f"    if err := validate_enum(data.get({field!r}), {name}, {name}_str, {field!r}):")
+        src.append("        errors.append(err)")
+    for field in rules.get("timestamps", []):
+        src.append(f"    if {field!r} in data:")
+        src.append(f"        if err := validate_timestamp(data[{field!r}]):")
+        src.append("            errors.append(err)")
+    if rules.get("blocked_requires_issues"):
+        src.append("    if data.get('status') == 'blocked' and not data.get('blocking_issues'):")
+        src.append("        errors.append(\"Status is 'blocked' but no blocking_issues provided (warning)\")")
+    src.append("    return errors")
+
+    exec(compile("\n".join(src), f"<validator {artifact_name}>", "exec"), namespace)
+    return namespace["validate"]
+
+
+@functools.lru_cache(maxsize=None)
+def _fallback_validator_for(schema_path: str, artifact_name: str) -> Callable[[Dict], List[str]]:
+    """Build the basic validator for an artifact/schema pair once per process."""
+    schema, _ = _load_schema_cached(schema_path)
+    return build_validator(schema, artifact_name)
 
 
 # =============================================================================
 # Main Validation
 # =============================================================================
 
-def validate_artifact(artifact_path: Path, schema_path: Optional[Path] = None) -> Tuple[bool, List[str]]:
+def validate_artifact(artifact_path: Path, schema_path: Optional[Path] = None,
+                      lines: Optional[List[str]] = None) -> Tuple[bool, List[str]]:
     """
     Validate an artifact against its schema.
 
+    Progress messages are appended to ``lines`` when given.
+
     Returns:
         Tuple of (success, error_messages)
     """
     errors = []
+    if lines is None:
+        lines = []
 
     # Load artifact
     data, err = load_json(artifact_path)
     if err:
         return False, [err]
 
-    print(f"  {Colors.GREEN}JSON syntax: OK{Colors.NC}")
+    lines.append(f"  {Colors.GREEN}JSON syntax: OK{Colors.NC}\n")
 
     # Get schema path if not provided
     if schema_path is None:
         schema_path = get_schema_path(artifact_path)
 
     if schema_path is None:
-        print(f"  {Colors.YELLOW}WARNING: No schema mapping for this artifact{Colors.NC}")
+        lines.append(f"  {Colors.YELLOW}WARNING: No schema mapping for this artifact{Colors.NC}\n")
         return True, []
 
     if not schema_path.exists():
-        print(f"  {Colors.YELLOW}WARNING: Schema not found: {schema_path}{Colors.NC}")
+        lines.append(f"  {Colors.YELLOW}WARNING: Schema not found: {schema_path}{Colors.NC}\n")
         return True, []
 
-    print(f"  Schema: {schema_path.name}")
+    lines.append(f"  Schema: {schema_path.name}\n")
 
     # Load schema
-    schema, err = load_json(schema_path)
+    schema, err = _load_schema_cached(str(schema_path))
     if err:
         return False, [f"Schema error: {err}"]
 
-    # Use jsonschema if available
-    if HAS_JSONSCHEMA:
-        errors = validate_with_jsonschema(data, schema)
+    # Use a full schema validator if available
+    if HAS_FASTJSONSCHEMA or HAS_JSONSCHEMA:
+        errors = _validator_for(str(schema_path))(data)
     else:
         # Fallback to basic validation
-        errors = validate_required_fields(data, schema)
-
-        # Run specific validators
-        artifact_name = artifact_path.name
-        if artifact_name == "stage-completion-signal.json":
-            errors.extend(validate_stage_completion_signal(data))
-        elif artifact_name == "workflow-state.json":
-            errors.extend(validate_workflow_state(data))
+        errors = _fallback_validator_for(str(schema_path), artifact_path.name)(data)
 
     return len(errors) == 0, errors
 
 
-def validate_file(artifact_path: str, schema_path: Optional[str] = None) -> bool:
-    """Validate a single file and print results."""
+def _validate_one(artifact_path: str, schema_path: Optional[str] = None) -> Tuple[bool, str]:
+    """Validate a single file, returning success and the rendered report."""
     artifact = Path(artifact_path)
-
-    print()
-    print(f"Validating: {artifact}")
-    print("-" * 40)
+    lines = ["\n", f"Validating: {artifact}\n", "-" * 40 + "\n"]
 
     schema = Path(schema_path) if schema_path else None
-    success, errors = validate_artifact(artifact, schema)
+    success, errors = validate_artifact(artifact, schema, lines)
 
     if success:
-        print(f"  {Colors.GREEN}PASSED{Colors.NC}")
+        lines.append(f"  {Colors.GREEN}PASSED{Colors.NC}\n")
     else:
         for err in errors:
-            print(f"  {Colors.RED}ERROR: {err}{Colors.NC}")
-        print(f"  {Colors.RED}FAILED with {len(errors)} error(s){Colors.NC}")
+            lines.append(f"  {Colors.RED}ERROR: {err}{Colors.NC}\n")
+        lines.append(f"  {Colors.RED}FAILED with {len(errors)} error(s){Colors.NC}\n")
+
+    return success, "".join(lines)
 
+
+def validate_file(artifact_path: str, schema_path: Optional[str] = None) -> bool:
+    """Validate a single file and print results."""
+    success, report = _validate_one(artifact_path, schema_path)
+    sys.stdout.write(report)
     return success
 
 
+def _warm_schema_cache(paths: List[str]):
+    """Load and compile the schemas needed for paths (worker process initializer)."""
+    for artifact_name in {os.path.basename(path) for path in paths}:
+        schema_name = ARTIFACT_SCHEMA_MAP.get(artifact_name)
+        if schema_name is None:
+            continue
+        schema_path = CONTRACTS_DIR / schema_name
+        if not schema_path.exists():
+            continue
+        schema, err = _load_schema_cached(str(schema_path))
+        if err is not None:
+            continue
+        if HAS_FASTJSONSCHEMA or HAS_JSONSCHEMA:
+            _validator_for(str(schema_path))
+        else:
+            _fallback_validator_for(str(schema_path), artifact_name)
+
+
+def _validate_many(paths: List[str]) -> Iterator[Tuple[bool, str]]:
+    """Validate files, in worker processes for large batches, in path order."""
+    workers = min(len(paths), os.cpu_count() or 1)
+    if workers <= 1 or len(paths) < PARALLEL_MIN_ARTIFACTS:
+        yield from map(_validate_one, paths)
+        return
+
+    # Imported here so single-file validation does not load multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Each worker compiles only the schemas these paths need, once, at
+    # startup; this holds under fork, spawn and forkserver alike
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_schema_cache,
+                             initargs=(paths,)) as executor:
+        yield from executor.map(_validate_one, paths, chunksize=chunksize)
+
+
+def _cache_fingerprint() -> List[Any]:
+    """Describe everything besides the artifact itself that affects a report."""
+    schemas = {}
+    for schema_name in sorted(set(ARTIFACT_SCHEMA_MAP.values())):
+        try:
+            schemas[schema_name] = (CONTRACTS_DIR / schema_name).stat().st_mtime_ns
+        except OSError:
+            schemas[schema_name] = None
+
+    # Error text depends on the interpreter (datetime.fromisoformat) and on
+    # the exact versions of the validator and JSON libraries. Imported here
+    # because only --all needs it.
+    import importlib.metadata
+
+    libraries = {}
+    for name in ("fastjsonschema", "jsonschema", "orjson"):
+        try:
+            libraries[name] = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            libraries[name] = None
+
+    return [
+        VALIDATE_CACHE_VERSION,
+        Path(__file__).stat().st_mtime_ns,
+        list(sys.version_info[:2]),
+        HAS_FASTJSONSCHEMA, HAS_JSONSCHEMA, HAS_ORJSON,
+        libraries,
+        bool(Colors.NC),
+        schemas,
+    ]
+
+
+def _load_cache(fingerprint: List[Any]) -> Dict[str, List[Any]]:
+    """Load cached results, discarding them if the fingerprint changed."""
+    data, err = load_json(VALIDATE_CACHE_PATH)
+    if err or not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+        return {}
+    artifacts = data.get("artifacts")
+    return artifacts if isinstance(artifacts, dict) else {}
+
+
+def _save_cache(fingerprint: List[Any], artifacts: Dict[str, List[Any]]):
+    """Write cached results; failures only cost a re-validation next time."""
+    tmp_path = VALIDATE_CACHE_PATH.with_suffix(".tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"fingerprint": fingerprint, "artifacts": artifacts}, f)
+        os.replace(tmp_path, VALIDATE_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _iter_artifacts(root: Path) -> Iterator[str]:
+    """Yield paths of known artifacts under root, skipping hidden directories."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+        for name in filenames:
+            if name in _KNOWN_NAMES:
+                yield os.path.join(dirpath, name)
+
+
 def validate_all() -> bool:
-    """Validate all artifacts in ARTIFACTS directory."""
+    """Validate all known artifacts in ARTIFACTS directory."""
     print("Validating all artifacts...")
     print("=" * 40)
 
@@ -298,17 +479,52 @@ def validate_all() -> bool:
         print(f"{Colors.RED}ERROR: ARTIFACTS directory not found{Colors.NC}")
         return False
 
-    total = 0
+    # Only files with a schema mapping are artifacts; skip logs and other JSON
+    paths = list(_iter_artifacts(ARTIFACTS_DIR))
+    total = len(paths)
     passed = 0
     failed = 0
 
-    for artifact in ARTIFACTS_DIR.rglob("*.json"):
-        total += 1
-        if validate_file(str(artifact)):
+    # Reuse results for artifacts whose mtime and size are unchanged
+    fingerprint = _cache_fingerprint()
+    cache = _load_cache(fingerprint)
+    cached = {}
+    signatures = {}
+    stale = []
+    for artifact in paths:
+        try:
+            st = os.stat(artifact)
+        except OSError:
+            # Removed since the walk; validation reports it and nothing is cached
+            stale.append(artifact)
+            continue
+        signature = [st.st_mtime_ns, st.st_size]
+        entry = cache.get(artifact)
+        if (isinstance(entry, list) and len(entry) == 4 and entry[:2] == signature
+                and isinstance(entry[2], bool) and isinstance(entry[3], str)):
+            cached[artifact] = entry
+        else:
+            signatures[artifact] = signature
+            stale.append(artifact)
+
+    # Artifacts are independent, so validate them in worker processes and
+    # print each report in order as it becomes available
+    results = _validate_many(stale)
+    for artifact in paths:
+        if artifact in cached:
+            _, _, success, report = cached[artifact]
+        else:
+            success, report = next(results)
+            if artifact in signatures:
+                cached[artifact] = signatures[artifact] + [success, report]
+        sys.stdout.write(report)
+        if success:
             passed += 1
         else:
             failed += 1
 
+    _save_cache(fingerprint, cached)
+
     print()
     print("=" * 40)
     print(f"Summary: {passed}/{total} passed")
@@ -328,7 +544,9 @@ def check_dependencies():
 
     print(f"  Python: {sys.version.split()[0]}")
 
-    if HAS_JSONSCHEMA:
+    if HAS_FASTJSONSCHEMA:
+        print(f"  {Colors.GREEN}✓{Colors.NC} fastjsonschema: available (full validation, compiled; reports first error only)")
+    elif HAS_JSONSCHEMA:
         print(f"  {Colors.GREEN}✓{Colors.NC} jsonschema: available (full validation)")
     else:
         print(f"  {Colors.YELLOW}✗{Colors.NC} jsonschema: not installed (basic validation only)")
@@ -336,6 +554,11 @@ def check_dependencies():
         print("  To enable full JSON Schema validation, install jsonschema:")
         print("    pip install jsonschema")
 
+    if HAS_ORJSON:
+        print(f"  {Colors.GREEN}✓{Colors.NC} orjson: available (fast JSON parsing)")
+    else:
+        print(f"  {Colors.YELLOW}✗{Colors.NC} orjson: not installed (using stdlib json)")
+
     print()
     print(f"  Contracts directory: {CONTRACTS_DIR}")
     if CONTRACTS_DIR.exists():